@@ -1,9 +1,11 @@
 package dsl
 
 import (
+	"compress/gzip"
 	"context"
 	"encoding/json"
 	"fmt"
+	"io"
 	"os"
 	"path/filepath"
 	"regexp"
@@ -522,12 +524,12 @@ func (o *OrchestratorAnalyzer) handleTwitterScraperResult(command string) {
 		return
 	}
 
-	// Find latest twitter_*.json file
+	// Find latest twitter_*.json (or .json.gz) file
 	var latestFile os.DirEntry
 	var latestTime time.Time
 
 	for _, file := range files {
-		if !strings.HasPrefix(file.Name(), "twitter_") || !strings.HasSuffix(file.Name(), ".json") {
+		if !isTwitterReport(file.Name()) {
 			continue
 		}
 
@@ -549,7 +551,7 @@ func (o *OrchestratorAnalyzer) handleTwitterScraperResult(command string) {
 
 	// Read and parse the file
 	filePath := filepath.Join(reportsDir, latestFile.Name())
-	fileContent, err := os.ReadFile(filePath)
+	fileContent, err := readReportFile(filePath)
 	if err != nil {
 		o.logger.Errorf("Failed to read file %s: %v", filePath, err)
 		return
@@ -652,7 +654,7 @@ func (o *OrchestratorAnalyzer) generateAndSendSummary(filename string, username
 
 	// Read the JSON file
 	filePath := fmt.Sprintf("/app/shared/reports/%s", filename)
-	fileContent, err := os.ReadFile(filePath)
+	fileContent, err := readReportFile(filePath)
 	if err != nil {
 		o.logger.Errorf("Failed to read file %s: %v", filePath, err)
 		return
@@ -694,6 +696,33 @@ func (o *OrchestratorAnalyzer) generateAndSendSummary(filename string, username
 	o.logger.Infof("✅ Published tweet summary for @%s", username)
 }
 
+// isTwitterReport reports whether name is a twitter scraper report, plain or gzip-compressed
+func isTwitterReport(name string) bool {
+	return strings.HasPrefix(name, "twitter_") &&
+		(strings.HasSuffix(name, ".json") || strings.HasSuffix(name, ".json.gz"))
+}
+
+// readReportFile reads a report from disk, transparently decompressing .gz files
+func readReportFile(path string) ([]byte, error) {
+	if !strings.HasSuffix(path, ".gz") {
+		return os.ReadFile(path)
+	}
+
+	f, err := os.Open(path)
+	if err != nil {
+		return nil, err
+	}
+	defer f.Close()
+
+	zr, err := gzip.NewReader(f)
+	if err != nil {
+		return nil, fmt.Errorf("failed to open gzip report: %w", err)
+	}
+	defer zr.Close()
+
+	return io.ReadAll(zr)
+}
+
 // extractTweetCountFromCommand extracts the tweet count from commands like "Summarize latest 20 username tweets"
 func (o *OrchestratorAnalyzer) extractTweetCountFromCommand(command string) int {
 	// Try to extract number from patterns like "latest 20", "last 30", etc.
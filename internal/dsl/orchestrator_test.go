@@ -0,0 +1,75 @@
+package dsl
+
+import (
+	"compress/gzip"
+	"os"
+	"path/filepath"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestIsTwitterReport(t *testing.T) {
+	tests := []struct {
+		name string
+		file string
+		want bool
+	}{
+		{"plain json", "twitter_alice_20250101_120000.json", true},
+		{"gzip json", "twitter_alice_20250101_120000.json.gz", true},
+		{"temp file", "twitter_alice_20250101_120000.json.tmp", false},
+		{"gzip temp file", "twitter_alice_20250101_120000.json.gz.tmp", false},
+		{"other report", "telegram_post_20250101_120000.json", false},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			assert.Equal(t, tt.want, isTwitterReport(tt.file))
+		})
+	}
+}
+
+func TestReadReportFile(t *testing.T) {
+	dir := t.TempDir()
+	content := []byte(`{"metadata":{"username":"alice","tweets_found":1},"tweets":[{"text":"hi"}]}`)
+
+	plainPath := filepath.Join(dir, "twitter_alice.json")
+	require.NoError(t, os.WriteFile(plainPath, content, 0o644))
+
+	gzPath := filepath.Join(dir, "twitter_alice.json.gz")
+	f, err := os.Create(gzPath)
+	require.NoError(t, err)
+	zw := gzip.NewWriter(f)
+	_, err = zw.Write(content)
+	require.NoError(t, err)
+	require.NoError(t, zw.Close())
+	require.NoError(t, f.Close())
+
+	badGzPath := filepath.Join(dir, "twitter_bad.json.gz")
+	require.NoError(t, os.WriteFile(badGzPath, content, 0o644))
+
+	tests := []struct {
+		name    string
+		path    string
+		want    []byte
+		wantErr bool
+	}{
+		{"plain json", plainPath, content, false},
+		{"gzip round trip", gzPath, content, false},
+		{"not gzip data", badGzPath, nil, true},
+		{"missing file", filepath.Join(dir, "missing.json"), nil, true},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			got, err := readReportFile(tt.path)
+			if tt.wantErr {
+				assert.Error(t, err)
+				return
+			}
+			require.NoError(t, err)
+			assert.Equal(t, tt.want, got)
+		})
+	}
+}
@@ -3,12 +3,30 @@ import json
 import sys
 import os
 import argparse
+import itertools
+import re
 
-def main():
-    parser = argparse.ArgumentParser(description='Python analyzer for Dagger')
-    parser.add_argument('--input_file', type=str, help='Input file to analyze')
+# Enough bytes for a 100-character preview even if every char is 4-byte UTF-8
+PREVIEW_BYTES = 400
+
+# Stats are computed on raw bytes, so they follow ASCII rules: words split on
+# bytes.split() whitespace (space, \t\n\r\v\f), digits are 0-9, and line
+# breaks are the ASCII ones str.splitlines() honours (\r\n counts once).
+# Non-ASCII spaces, digits and separators such as U+2028 are not recognised.
+DIGIT_RE = re.compile(rb'[0-9]')
+LINE_BREAKS = (b'\n', b'\r', b'\x0b', b'\x0c', b'\x1c', b'\x1d', b'\x1e')
+
+MAX_LISTED_FILES = 50
+
+# Large reads keep the per-chunk Python overhead negligible next to the
+# C-level bytes.count/bytes.split/regex scans that do the actual counting
+CHUNK_SIZE = 1 << 20
 
-    args = parser.parse_args()
+PARSER = argparse.ArgumentParser(description='Python analyzer for Dagger')
+PARSER.add_argument('--input_file', type=str, help='Input file to analyze')
+
+def main():
+    args = PARSER.parse_args()
 
     if not args.input_file:
         print(json.dumps({
@@ -27,26 +45,57 @@ def main():
 
     try:
         if os.path.exists(input_path):
-            with open(input_path, 'r') as f:
-                content = f.read()
+            # Single pass over the raw bytes: no full decode, no word/line lists
+            word_count = 0
+            line_count = 0
+            has_numbers = False
+            last_byte = b""
+            with open(input_path, 'rb') as f:
+                # Size comes from the inode; only the preview head is ever decoded
+                content_length = os.fstat(f.fileno()).st_size
+                head = f.read(PREVIEW_BYTES)
+                for chunk in itertools.chain((head,), iter(lambda: f.read(CHUNK_SIZE), b'')):
+                    line_count += sum(map(chunk.count, LINE_BREAKS)) - chunk.count(b'\r\n')
+                    # A \r\n split across the chunk boundary was counted twice
+                    if last_byte == b'\r' and chunk[:1] == b'\n':
+                        line_count -= 1
+                    word_count += len(chunk.split())
+                    # A word split across the chunk boundary was counted twice
+                    if last_byte and not last_byte.isspace() and not chunk[:1].isspace():
+                        word_count -= 1
+                    if not has_numbers:
+                        has_numbers = DIGIT_RE.search(chunk) is not None
+                    last_byte = chunk[-1:]
+            # Count a trailing line that has no line break, like str.splitlines()
+            if last_byte and last_byte not in LINE_BREAKS:
+                line_count += 1
+
+            # Normalize newlines as text-mode reading would
+            preview = head.decode('utf-8', 'replace').replace('\r\n', '\n').replace('\r', '\n')
+            truncated = len(preview) > 100 or content_length > len(head)
 
             analysis_result = {
                 "status": "success",
                 "message": f"Python analyzer executed successfully via Dagger",
                 "input_file": input_file,
-                "content_length": len(content),
-                "content_preview": content[:100] + "..." if len(content) > 100 else content,
+                "content_length": content_length,
+                "content_preview": preview[:100] + "..." if truncated else preview,
                 "analysis": {
-                    "word_count": len(content.split()),
-                    "line_count": len(content.splitlines()),
-                    "has_numbers": any(c.isdigit() for c in content)
+                    "word_count": word_count,
+                    "line_count": line_count,
+                    "has_numbers": has_numbers
                 }
             }
         else:
+            # Only a hint for the error message: list lazily and cap the count
+            available_files = []
+            if os.path.exists("/shared"):
+                with os.scandir("/shared") as entries:
+                    available_files = [e.name for e in itertools.islice(entries, MAX_LISTED_FILES)]
             analysis_result = {
                 "status": "error",
                 "message": f"Input file {input_file} not found in /shared/",
-                "available_files": os.listdir("/shared") if os.path.exists("/shared") else []
+                "available_files": available_files
             }
 
     except Exception as e:
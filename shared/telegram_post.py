@@ -10,12 +10,12 @@ import argparse
 import datetime
 import requests
 
-def main():
-    parser = argparse.ArgumentParser(description='Telegram message poster for Dagger using Telegram Bot API')
-    parser.add_argument('--message', type=str, help='Message content to post')
-    parser.add_argument('--channel', type=str, help='Channel ID (optional, uses default from env if not provided)')
+PARSER = argparse.ArgumentParser(description='Telegram message poster for Dagger using Telegram Bot API')
+PARSER.add_argument('--message', type=str, help='Message content to post')
+PARSER.add_argument('--channel', type=str, help='Channel ID (optional, uses default from env if not provided)')
 
-    args = parser.parse_args()
+def main():
+    args = PARSER.parse_args()
 
     message = args.message or os.environ.get('message') or os.environ.get('MESSAGE')
     if not message:
@@ -55,8 +55,10 @@ def main():
             chat_title = chat_info.get('title', 'Unknown Channel')
             chat_username = chat_info.get('username', '')
 
-            # Create timestamp for logging
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            # Create timestamp for logging from a single clock read
+            now = datetime.datetime.now()
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
+            posted_at = now.isoformat()
 
             # Create message preview (first 100 chars)
             message_preview = message[:100] + ("..." if len(message) > 100 else "")
@@ -75,7 +77,7 @@ def main():
 
             log_data = {
                 'metadata': {
-                    'posted_at': datetime.datetime.now().isoformat(),
+                    'posted_at': posted_at,
                     'channel_id': channel_id,
                     'channel_title': chat_title,
                     'message_id': message_id,
@@ -106,7 +108,7 @@ def main():
                     "message_preview": message_preview,
                     "message_length": len(message),
                     "telegram_link": telegram_link,
-                    "posted_at": datetime.datetime.now().isoformat(),
+                    "posted_at": posted_at,
                     "saved_to": log_filename,
                     "saved_to_path": log_filepath,
                     "download_url": f"{os.environ.get('AGENT_BASE_URL', 'http://localhost:8000')}/reports/{log_filename}"
@@ -3,36 +3,95 @@
 Twitter Scraper using Apify API
 Scrapes tweets from a specified Twitter username/channel
 """
-import json
 import sys
 import os
 import argparse
 import datetime
+import gzip
+import orjson
 from apify_client import ApifyClient
 
-def main():
-    parser = argparse.ArgumentParser(description='Twitter scraper for Dagger using Apify API')
-    parser.add_argument('--username', type=str, help='Twitter username/handle to scrape (without @)')
-    parser.add_argument('--tweets_count', type=int, default=50, help='Number of tweets to scrape (default: 50)')
+def env_flag(name):
+    """Parse a boolean env var; None when unset so the actor default applies"""
+    value = os.environ.get(name)
+    if not value:
+        return None
+    return value.lower() in ('1', 'true', 'yes')
+
+# Actor selection and static run input, resolved once from the environment
+ACTOR_ID = os.environ.get('APIFY_ACTOR_ID', '').strip() or 'apidojo~tweet-scraper'
+IS_TWEET_SCRAPER = ACTOR_ID.startswith(('apidojo~tweet-scraper', 'apidojo/tweet-scraper'))
+QUERY = os.environ.get('QUERY')
+
+# Reports are machine-read via /reports; pretty-print only when debugging
+REPORT_OPTIONS = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if env_flag('PRETTY_REPORTS') else 0)
+# Opt-in gzip for saved reports; the repetitive JSON keys compress 4-8x
+COMPRESS_REPORTS = bool(env_flag('COMPRESS_REPORTS'))
+
+if IS_TWEET_SCRAPER:
+    BASE_RUN_INPUT = {"searchMode": "live"}
+    if os.environ.get('TWEET_LANGUAGE'):
+        BASE_RUN_INPUT["tweetLanguage"] = os.environ['TWEET_LANGUAGE']
+    for input_key, env_name in (("includeRetweets", 'INCLUDE_RETWEETS'), ("includeReplies", 'INCLUDE_REPLIES')):
+        flag = env_flag(env_name)
+        if flag is not None:
+            BASE_RUN_INPUT[input_key] = flag
+else:
+    # web.harvester input (requires paid/rented actor)
+    PROXY_GROUPS = [g.strip() for g in os.environ.get('APIFY_PROXY_GROUPS', '').split(',') if g.strip()]
+    PROXY_CONFIG = {"useApifyProxy": True}
+    if PROXY_GROUPS:
+        PROXY_CONFIG["apifyProxyGroups"] = PROXY_GROUPS
+    BASE_RUN_INPUT = {
+        "userQueries": [],
+        "profilesDesired": 1,
+        "proxyConfig": PROXY_CONFIG,
+    }
+
+def first(d, keys, default=0):
+    """Return the value of the first key present in d, or default"""
+    return next((d[k] for k in keys if k in d), default)
+
+def first_truthy(d, keys, default=None):
+    """Return the first non-empty value among keys in d, or default"""
+    return next(filter(None, map(d.get, keys)), default)
+
+# Normalized tweet schema: (output key, lookup, source keys in priority order, default).
+# Actors disagree on naming; text-like fields take the first non-empty value,
+# counters take the first key present.
+TWEET_SCHEMA = (
+    ('id', first_truthy, ('id', 'id_str'), None),
+    ('text', first_truthy, ('text', 'full_text', 'content'), ''),
+    ('created_at', first_truthy, ('createdAt', 'created_at', 'date'), None),
+    ('retweet_count', first, ('retweetCount', 'retweet_count'), 0),
+    ('like_count', first, ('likeCount', 'favorite_count', 'like_count'), 0),
+    ('reply_count', first, ('replyCount', 'reply_count'), 0),
+    ('url', first_truthy, ('url', 'tweetUrl'), ''),
+)
+
+PARSER = argparse.ArgumentParser(description='Twitter scraper for Dagger using Apify API')
+PARSER.add_argument('--username', type=str, help='Twitter username/handle to scrape (without @)')
+PARSER.add_argument('--tweets_count', type=int, default=50, help='Number of tweets to scrape (default: 50)')
 
-    args = parser.parse_args()
+def main():
+    args = PARSER.parse_args()
 
     # Support username from environment (for container engines passing env vars)
     username = args.username or os.environ.get('username') or os.environ.get('USERNAME') or os.environ.get('TWITTER_USERNAME')
     if not username:
-        print(json.dumps({
+        print(orjson.dumps({
             "status": "error",
             "message": "No username provided. Use --username parameter or set env var 'username'/'USERNAME'/'TWITTER_USERNAME'."
-        }))
+        }).decode())
         return
 
     # Get Apify API token from environment (do not hardcode tokens)
     apify_token = ""
     if not apify_token:
-        print(json.dumps({
+        print(orjson.dumps({
             "status": "error",
             "message": "APIFY_API_TOKEN environment variable not set"
-        }))
+        }).decode())
         return
 
     try:
@@ -42,68 +101,41 @@ def main():
         # Clean username (remove @ if present)
         username = username.lstrip('@')
 
-        # Select actor and prepare input
-        actor_id = os.environ.get('APIFY_ACTOR_ID', '').strip()
+        # Only the per-call fields change; the rest comes from BASE_RUN_INPUT
         tweets_desired = int(os.environ.get('tweets_count', args.tweets_count))
 
-        if actor_id.startswith('apidojo~tweet-scraper') or actor_id.startswith('apidojo/tweet-scraper') or actor_id == '':
-            # Default to apidojo actor if not specified
-            if not actor_id:
-                actor_id = 'apidojo~tweet-scraper'
-
-            query = os.environ.get('QUERY') or f"from:{username}"
+        if IS_TWEET_SCRAPER:
             run_input = {
-                "searchMode": "live",
-                "searchTerms": [query],
+                **BASE_RUN_INPUT,
+                "searchTerms": [QUERY or f"from:{username}"],
                 "maxItems": tweets_desired,
             }
-            if os.environ.get('TWEET_LANGUAGE'):
-                run_input["tweetLanguage"] = os.environ.get('TWEET_LANGUAGE')
-            if os.environ.get('INCLUDE_RETWEETS'):
-                run_input["includeRetweets"] = os.environ.get('INCLUDE_RETWEETS').lower() in ('1', 'true', 'yes')
-            if os.environ.get('INCLUDE_REPLIES'):
-                run_input["includeReplies"] = os.environ.get('INCLUDE_REPLIES').lower() in ('1', 'true', 'yes')
         else:
-            # web.harvester input (requires paid/rented actor)
-            proxy_config = {"useApifyProxy": True}
-            proxy_groups = os.environ.get('APIFY_PROXY_GROUPS')
-            if proxy_groups:
-                groups = [g.strip() for g in proxy_groups.split(',') if g.strip()]
-                if groups:
-                    proxy_config["apifyProxyGroups"] = groups
-
             run_input = {
+                **BASE_RUN_INPUT,
                 "handles": [username],
-                "userQueries": [],
                 "tweetsDesired": tweets_desired,
-                "profilesDesired": 1,
-                "proxyConfig": proxy_config,
             }
 
-        print(json.dumps({
+        print(orjson.dumps({
             "status": "processing",
             "message": f"🐦 Scraping {args.tweets_count} tweets from @{username}..."
-        }))
+        }).decode())
 
         # Run the Actor and wait for it to finish
-        run = client.actor(actor_id).call(run_input=run_input, timeout_secs=300)
+        run = client.actor(ACTOR_ID).call(run_input=run_input, timeout_secs=300)
 
         # Fetch results from the dataset
         dataset_id = run.get("defaultDatasetId")
-        items = list(client.dataset(dataset_id).iterate_items()) if dataset_id else []
-
-        if not items:
-            print(json.dumps({
-                "status": "error",
-                "message": f"No data found for username @{username}. Check if the username exists and is public."
-            }))
-            return
+        items = client.dataset(dataset_id).iterate_items() if dataset_id else ()
 
-        # Separate tweets and profile data
+        # Separate tweets and profile data while streaming the dataset
         tweets = []
         profile_data = None
+        got_any = False
 
         for item in items:
+            got_any = True
             # Profile-like data
             if item.get('type') == 'profile' or 'followersCount' in item:
                 profile_data = {
@@ -117,33 +149,32 @@ def main():
                 }
                 continue
 
+            # Actors may over-deliver; once enough tweets are in, skip normalizing
+            # the rest but keep scanning so profile items (checked above) still apply
+            if len(tweets) >= tweets_desired:
+                continue
+
             # Tweet-like data (normalize keys across actors)
-            text_val = item.get('text') or item.get('full_text') or item.get('content', '')
-            created_val = item.get('createdAt') or item.get('created_at') or item.get('date')
-            retweets_val = item.get('retweetCount', item.get('retweet_count', 0))
-            likes_val = item.get('likeCount', item.get('favorite_count', item.get('like_count', 0)))
-            replies_val = item.get('replyCount', item.get('reply_count', 0))
-            url_val = item.get('url') or item.get('tweetUrl') or ''
-            tid = item.get('id') or item.get('id_str')
-
-            if text_val or url_val:
-                tweets.append({
-                    'id': tid,
-                    'text': text_val,
-                    'created_at': created_val,
-                    'retweet_count': retweets_val,
-                    'like_count': likes_val,
-                    'reply_count': replies_val,
-                    'url': url_val
-                })
-
-        # Create timestamp for file naming
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            tweet = {key: lookup(item, keys, default) for key, lookup, keys, default in TWEET_SCHEMA}
+            if tweet['text'] or tweet['url']:
+                tweets.append(tweet)
+
+        if not got_any:
+            print(orjson.dumps({
+                "status": "error",
+                "message": f"No data found for username @{username}. Check if the username exists and is public."
+            }).decode())
+            return
+
+        # Create timestamp for file naming and metadata from a single clock read
+        now = datetime.datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        scraped_at = now.isoformat()
 
         # Prepare full data for JSON export
         full_data = {
             'metadata': {
-                'scraped_at': datetime.datetime.now().isoformat(),
+                'scraped_at': scraped_at,
                 'username': username,
                 'tweets_requested': args.tweets_count,
                 'tweets_found': len(tweets)
@@ -156,11 +187,28 @@ def main():
         reports_dir = "/shared/reports"
         os.makedirs(reports_dir, exist_ok=True)
 
-        json_filename = f"twitter_{username}_{timestamp}.json"
+        json_filename = f"twitter_{username}_{timestamp}.json" + (".gz" if COMPRESS_REPORTS else "")
         json_filepath = os.path.join(reports_dir, json_filename)
 
-        with open(json_filepath, 'w', encoding='utf-8') as f:
-            json.dump(full_data, f, ensure_ascii=False, indent=2)
+        # orjson returns the complete payload, so it goes out in one write() call.
+        # Write to a temp file and rename so /reports never serves a partial file;
+        # the report is regenerable, so no fsync.
+        payload = orjson.dumps(full_data, option=REPORT_OPTIONS)
+        if COMPRESS_REPORTS:
+            # Level 1: most of the size win for a fraction of the CPU
+            payload = gzip.compress(payload, compresslevel=1)
+        tmp_filepath = json_filepath + '.tmp'
+        try:
+            with open(tmp_filepath, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_filepath, json_filepath)
+        except BaseException:
+            # Don't leave a partial .tmp behind for the /reports route to serve
+            try:
+                os.unlink(tmp_filepath)
+            except OSError:
+                pass
+            raise
 
         # Prepare summary for UI chat
         summary_tweets = tweets[:5]  # Show first 5 tweets in summary
@@ -187,7 +235,7 @@ def main():
             "message": f"Error scraping Twitter data: {str(e)}"
         }
 
-    print(json.dumps(result, ensure_ascii=False, indent=2))
+    print(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())
 
 if __name__ == "__main__":
     main()